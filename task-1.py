@@ -1,7 +1,8 @@
-from typing import List
-from collections import UserDict
-from datetime import datetime, timedelta
-from tabulate import tabulate
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from datetime import date, timedelta
 
 def input_error(func):
     def inner(*args, **kwargs):
@@ -18,65 +19,104 @@ def input_error(func):
 
     return inner 
 
+_PHONE_RE = re.compile(r'[0-9]{10}\Z')
+_BIRTHDAY_RE = re.compile(r'[0-9]{2}\.[0-9]{2}\.[0-9]{4}\Z')
+
+def _validate_phone(value: str):
+    if not _PHONE_RE.match(value):
+        raise ValueError("Invalid phone number. Please provide a 10-digit phone number.")
+
 class Field:
+    __slots__ = ('value',)
+
     def __init__(self, value: str):
         if not value:
             raise ValueError("Field cannot be empty.")
         self.value = value
 
+    def __setattr__(self, name, value):
+        # Instances are shared between records (see _phone/_birthday), so fields are write-once.
+        if hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__}.{name} cannot be changed.")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__}.{name} cannot be deleted.")
+
     def __str__(self):
         return str(self.value)
 
 class Name(Field):
+    __slots__ = ()
+
     def __init__(self, value: str):
         if not value.strip():
             raise ValueError("Name cannot be empty.")
         super().__init__(value)
 
 class Phone(Field):
+    __slots__ = ()
+
     def __init__(self, value: str):
-        if not value.isdigit() or len(value) != 10:
-            raise ValueError("Invalid phone number. Please provide a 10-digit phone number.")
+        _validate_phone(value)
         super().__init__(value)
 
 class Birthday(Field):
+    __slots__ = ('date',)
+
     def __init__(self, value: str):
         try:
-            datetime.strptime(value, "%d.%m.%Y")
+            if not _BIRTHDAY_RE.match(value):
+                raise ValueError
+            self.date = date(int(value[6:10]), int(value[3:5]), int(value[0:2]))
         except ValueError:
             raise ValueError("Invalid date format. Please use DD.MM.YYYY.")
         super().__init__(value)
 
+@lru_cache(maxsize=65536)
+def _phone(value: str) -> Phone:
+    return Phone(value)
+
+@lru_cache(maxsize=65536)
+def _birthday(value: str) -> Birthday:
+    return Birthday(value)
+
 class Record:
+    __slots__ = ('name', 'phones', 'birthday')
+
     def __init__(self, name: Name):
-        self.name = Name(name)
-        self.phones: List[Phone] = []
+        self.name = name if isinstance(name, Name) else Name(name)
+        self.phones: Dict[str, Phone] = {}
         self.birthday: Birthday = None
 
     def add_phone(self, phone_number: str):
-        self.phones.append(Phone(phone_number))
+        self.attach_phone(_phone(phone_number))
+
+    def attach_phone(self, phone: Phone):
+        self.phones[phone.value] = phone
+
+    def bulk_add_phones(self, phone_numbers: List[str]):
+        phones = [_phone(phone_number) for phone_number in phone_numbers]
+        for phone in phones:
+            self.attach_phone(phone)
 
     def add_birthday(self, birthday: str):
-        self.birthday = Birthday(birthday)
+        self.attach_birthday(_birthday(birthday))
+
+    def attach_birthday(self, birthday: Birthday):
+        self.birthday = birthday
 
     def remove_phone(self, phone_number: str):
-        self.phones = [phone for phone in self.phones if phone.value != phone_number]
+        self.phones.pop(phone_number, None)
 
     def edit_phone(self, old_phone_number: str, new_phone_number: str):
-        if not new_phone_number.isdigit() or len(new_phone_number) != 10:
-            raise ValueError("Invalid phone number. Please provide a 10-digit phone number.")
-        for phone in self.phones:
-            if phone.value == old_phone_number:
-                phone.value = new_phone_number
-                break
-        else:
+        new_phone = _phone(new_phone_number)
+        if self.phones.pop(old_phone_number, None) is None:
             raise ValueError("Phone number not found.")
+        self.phones[new_phone_number] = new_phone
 
     def find_phone(self, phone_number: str) -> Phone:
-        for phone in self.phones:
-            if phone.value == phone_number:
-                return phone
-        return None
+        return self.phones.get(phone_number)
     
     def show_birthday(self):
         if self.birthday:
@@ -85,158 +125,208 @@ class Record:
             return f"No birthday found for {self.name.value}"
 
     def __str__(self):
-        phone_numbers = '; '.join(phone.value for phone in self.phones)
+        phone_numbers = '; '.join(self.phones)
         return f"Contact name: {self.name.value}, phones: {phone_numbers}, birthday: {self.birthday}"
 
-class AddressBook(UserDict):
+def _birthday_in_year(birthday: date, year: int) -> date:
+    try:
+        return birthday.replace(year=year)
+    except ValueError:
+        # 29.02 in a non-leap year is celebrated on 28.02.
+        return date(year, 2, 28)
+
+class AddressBook(dict):
     def add_record(self, record: Record):
-            self.data[record.name.value] = record
+            self[record.name.value] = record
             
     def get_upcoming_birthdays(self):
-        tdate = datetime.today().date()
+        tdate = date.today()
+        today_ord = tdate.toordinal()
+        end_ord = today_ord + 7
         upcoming_birthdays = []
 
-        for record_list in self.data.values():
-            for record in record_list:
-                if record.birthday:
-                    bdate_components = record.birthday.value.split('.')
-                    bdate = datetime.strptime(f"{tdate.year}-{bdate_components[1]}-{bdate_components[0]}", "%Y-%m-%d").date()
-                    days_between = (bdate - tdate).days
-                    week_day = bdate.isoweekday()
-
-                    if 0 <= days_between < 7 and (week_day < 6 or (bdate + timedelta(days=(1 if week_day == 6 else 2))).weekday() == 0):
-                        formatted_birthday = bdate.strftime("%d %B")
-                        upcoming_birthdays.append(f"{record.name.value} {formatted_birthday}")
+        for record in self.values():
+            if record.birthday:
+                bdate = _birthday_in_year(record.birthday.date, tdate.year)
+                bday_ord = bdate.toordinal()
+                if bday_ord < today_ord:
+                    bdate = _birthday_in_year(record.birthday.date, tdate.year + 1)
+                    bday_ord = bdate.toordinal()
+                week_day = bdate.isoweekday()
+
+                if today_ord <= bday_ord < end_ord and (week_day < 6 or (bdate + timedelta(days=(1 if week_day == 6 else 2))).weekday() == 0):
+                    formatted_birthday = bdate.strftime("%d %B")
+                    upcoming_birthdays.append(f"{record.name.value} {formatted_birthday}")
         return upcoming_birthdays
 
 
     def find(self, name: str) -> Record:
-        if name in self.data:
-            return self.data[name]
-        else:
-            return None
+        return self.get(name)
+
+    def bulk_import(self, records: List[Tuple[str, str, str]]):
+        parsed = []
+        for name, phone, birthday in records:
+            parsed.append((
+                Name(name),
+                _phone(phone),
+                _birthday(birthday) if birthday else None,
+            ))
+
+        for name, phone, birthday in parsed:
+            record = self.find(name.value)
+            if not record:
+                record = Record(name)
+                self.add_record(record)
+            record.attach_phone(phone)
+            if birthday:
+                record.attach_birthday(birthday)
         
-    def show_all_contacts(self):
-        if not self.data:
+    def show_all_contacts(self, fancy: bool = False):
+        if not self:
             return "No contacts found."
-        else:
+        table_data = []
+        for record in self.values():
+            birthday = record.birthday
+            table_data.append([record.name.value, '; '.join(record.phones), birthday.value if birthday else "N/A"])
+        if fancy:
+            from tabulate import tabulate
             headers = []
-            table_data = [[record.name.value, '; '.join(phone.value for phone in record.phones), record.birthday.value if record.birthday else "N/A"] for record_list in self.data.values() for record in record_list]
             return tabulate(table_data, headers=headers, tablefmt="grid")
+        name_w = max(len(row[0]) for row in table_data)
+        ph_w = max(len(row[1]) for row in table_data)
+        return '\n'.join(f"{name:<{name_w}} | {phones:<{ph_w}} | {bday}" for name, phones, bday in table_data)
 
     def delete(self, name: str):
-        if name in self.data:
-            del self.data[name]
+        if name in self:
+            del self[name]
             return f"Contact '{name}' deleted."
         else:
             return f"Contact '{name}' not found."
 
+def handle_hello(book: AddressBook, args):
+    print("How can I help you?")
+
+def handle_add(book: AddressBook, args):
+    if len(args) != 2:
+        print("Invalid format. Please use: add [name] [phone]")
+    else:
+        name, phone = args
+        try:
+            record = book.find(name)
+            if not record:
+                record = Record(name)
+                book.add_record(record)
+                record.add_phone(phone)
+                print("Contact added.")
+            else:
+                print("Contact with this name already exists.")
+        except ValueError as e:
+            print(e)
+
+def handle_change(book: AddressBook, args):
+    if len(args) != 3:
+        print("Invalid format. Please use: change [name] [old phone] [new phone]")
+    else:
+        name, old_phone, new_phone = args
+        record = book.find(name)
+        if record:
+            try:
+                record.edit_phone(old_phone, new_phone)
+                print("Phone number updated.")
+            except ValueError as e:
+                print(e)
+        else:
+            print("Contact not found.")
+
+def handle_phone(book: AddressBook, args):
+    if len(args) != 1:
+        print("Invalid format. Please use: phone [name]")
+    else:
+        name = args[0]
+        record = book.find(name)
+        if record:
+            print(record)
+        else:
+            print("Contact not found.")
+
+def handle_add_birthday(book: AddressBook, args):
+    if len(args) != 2:
+        print("Invalid format. Please use: add-birthday [name] [birthday (DD.MM.YYYY)]")
+    else:
+        name, birthday = args
+        record = book.find(name)
+        if record:
+            try:
+                record.add_birthday(birthday)
+                print("Birthday added.")
+            except ValueError as e:
+                print(e)
+        else:
+            print("Contact not found.")
+
+def handle_delete(book: AddressBook, args):
+    if len(args) == 1:
+        name = args[0]
+        print(book.delete(name))
+    else:
+        print("Invalid format. Please use: delete [name]")
+
+def handle_show_birthday(book: AddressBook, args):
+    if len(args) == 1:
+        name = args[0]
+        record = book.find(name)
+        if record:
+            print(record.show_birthday())
+        else:
+            print("Contact not found.")
+    else:
+        print("Invalid format. Please use: show-birthday [name]")
+
+def handle_birthdays(book: AddressBook, args):
+    upcoming_birthdays = book.get_upcoming_birthdays()
+    if not upcoming_birthdays:
+        print("No upcoming birthdays in the next week.")
+    else:
+        print("Upcoming birthdays:")
+        for record in upcoming_birthdays:
+            print(record)
+
+def handle_all(book: AddressBook, args):
+    all_contacts = book.show_all_contacts()
+    print(all_contacts)
+
+HANDLERS = {sys.intern(command): handler for command, handler in {
+    "hello": handle_hello,
+    "add": handle_add,
+    "change": handle_change,
+    "phone": handle_phone,
+    "add-birthday": handle_add_birthday,
+    "delete": handle_delete,
+    "show-birthday": handle_show_birthday,
+    "birthdays": handle_birthdays,
+    "all": handle_all,
+}.items()}
+
 @input_error
 def main():
     book = AddressBook()
     print("Welcome to the assistant bot!")
     while True:
-        user_input = input("Enter a command: ").split()
-        command, args = user_input[0], user_input[1:]
+        line = input("Enter a command: ").strip()
+        if not line:
+            continue
+        command, *rest = line.split(None, 1)
+        args = rest[0].split() if rest else ()
 
         if command in ["close", "exit"]:
             print("Good bye!")
             break
 
-        elif command == "hello":
-            print("How can I help you?")
-
-        elif command == "add":
-            if len(args) != 2:
-                print("Invalid format. Please use: add [name] [phone]")
-            else:
-                name, phone = args
-                try:
-                    record = book.find(name)
-                    if not record:
-                        record = Record(name)
-                        book.add_record(record)
-                        record.add_phone(phone)
-                        print("Contact added.")
-                    else:
-                        print("Contact with this name already exists.")
-                except ValueError as e:
-                    print(e)
-            
-        elif command == "change":
-            if len(args) != 3:
-                print("Invalid format. Please use: change [name] [old phone] [new phone]")
-            else:
-                name, old_phone, new_phone = args
-                record = book.find(name)
-                if record:
-                    try:
-                        record.edit_phone(old_phone, new_phone)
-                        print("Phone number updated.")
-                    except ValueError as e:
-                        print(e)
-                else:
-                    print("Contact not found.")
-
-        elif command == "phone":
-            if len(args) != 1:
-                print("Invalid format. Please use: phone [name]")
-            else:
-                name = args[0]
-                record = book.find(name)
-                if record:
-                    print(record)
-                else:
-                    print("Contact not found.")
-
-        elif command == "add-birthday":
-            if len(args) != 2:
-                print("Invalid format. Please use: add-birthday [name] [birthday (DD.MM.YYYY)]")
-            else:
-                name, birthday = args
-                record = book.find(name)
-                if record:
-                    try:
-                        record.add_birthday(birthday)
-                        print("Birthday added.")
-                    except ValueError as e:
-                        print(e)
-                else:
-                    print("Contact not found.")
-        
-        elif command == "delete":
-            if len(args) == 1:
-                name = args[0]
-                print(book.delete(name))
-            else:
-                print("Invalid format. Please use: delete [name]")
-
-        elif command == "show-birthday":
-            if len(args) == 1:
-                name = args[0]
-                record = book.find(name)
-                if record:
-                    print(record.show_birthday())
-                else:
-                    print("Contact not found.")
-            else:
-                print("Invalid format. Please use: show-birthday [name]")
-
-        elif command == "birthdays":
-            upcoming_birthdays = book.get_upcoming_birthdays()
-            if not upcoming_birthdays:
-                print("No upcoming birthdays in the next week.")
-            else:
-                print("Upcoming birthdays:")
-                for record in upcoming_birthdays:
-                    print(record)
-                    
-        elif command == "all":
-            all_contacts = book.show_all_contacts()
-            print(all_contacts)
-
-        else:
+        handler = HANDLERS.get(command)
+        if handler is None:
             print("Invalid command.")
+        else:
+            handler(book, args)
 
 if __name__ == "__main__":
     main()